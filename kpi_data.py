@@ -0,0 +1,173 @@
+"""
+Data loading for the Employee KPI Dashboard, kept out of streamlit_app.py so
+serve.py can import and warm it in the server process before any session
+connects. Nothing in this module calls Streamlit.
+"""
+import threading
+import time
+
+import pandas as pd
+import numpy as np
+
+_warm_lock = threading.Lock()
+_warm_state = None
+
+def read_workbook():
+    """
+    Reads the KPI sheets from the workbook. Returns (data, errors) so callers
+    render load failures themselves.
+    """
+    file_path = "Enhanced_25_Employee_KPI_Dashboard.xlsx"
+    sheets = [
+        "Role_vs_Reality_Analysis",
+        "Hidden_Capacity_Burnout_Risk",
+        "Work_Models_Effectiveness",
+        "Digital_Collaboration_Overload",
+        "Digital_Wellbeing_Index",
+        "Data_Driven_Skill_Gap_Analysis",
+        "High_Value_Work_Ratio",
+        "Future_Skill_Readiness_Index",
+        "Shadow_IT_Risk_Score"
+    ]
+    
+    all_data = {}
+    errors = []
+    for sheet in sheets:
+        try:
+            df = pd.read_excel(file_path, sheet_name=sheet)
+            all_data[sheet] = df
+        except Exception as e:
+            errors.append(f"Could not load {sheet}: {e}")
+    return all_data, errors
+
+def load_plotly():
+    """
+    Imports Plotly on first use instead of at module top.
+    plotly.express is slow to import; later calls hit the module cache.
+    """
+    import plotly.express as px
+    import plotly.graph_objects as go
+    return px, go
+
+def build_mock_role_reality_data():
+    """
+    Creates realistic mock data for Role vs. Reality Analysis
+    This simulates process mining data showing time allocation
+    """
+    np.random.seed(42)
+    
+    roles = ['Senior Engineer', 'Sales Manager', 'Data Analyst', 'Product Manager', 
+             'Marketing Lead', 'Finance Analyst', 'Operations Manager', 'HR Business Partner']
+    departments = ['Engineering', 'Sales', 'Analytics', 'Product', 
+                   'Marketing', 'Finance', 'Operations', 'HR']
+    months = pd.date_range('2025-04-01', '2025-09-01', freq='MS')
+    
+    data_list = []
+    
+    for month in months:
+        for i, (role, dept) in enumerate(zip(roles, departments)):
+            # Create 3-5 employees per role
+            for emp_num in range(np.random.randint(3, 6)):
+                emp_id = f"{dept[:3].upper()}{i:02d}{emp_num}"
+                
+                # Salary ranges by role (annual)
+                salary_map = {
+                    'Senior Engineer': np.random.randint(110000, 140000),
+                    'Sales Manager': np.random.randint(90000, 120000),
+                    'Data Analyst': np.random.randint(70000, 90000),
+                    'Product Manager': np.random.randint(100000, 130000),
+                    'Marketing Lead': np.random.randint(80000, 110000),
+                    'Finance Analyst': np.random.randint(65000, 85000),
+                    'Operations Manager': np.random.randint(75000, 95000),
+                    'HR Business Partner': np.random.randint(70000, 90000)
+                }
+                
+                annual_salary = salary_map[role]
+                monthly_salary = annual_salary / 12
+                
+                # Total working hours per month (approx 160 hours)
+                total_hours = 160
+                
+                # Time allocation (varies by role)
+                if role == 'Senior Engineer':
+                    core_pct = np.random.uniform(0.50, 0.70)
+                    repetitive_pct = np.random.uniform(0.15, 0.30)
+                    admin_pct = np.random.uniform(0.05, 0.15)
+                elif role in ['Sales Manager', 'Product Manager']:
+                    core_pct = np.random.uniform(0.40, 0.60)
+                    repetitive_pct = np.random.uniform(0.10, 0.25)
+                    admin_pct = np.random.uniform(0.10, 0.25)
+                else:
+                    core_pct = np.random.uniform(0.45, 0.65)
+                    repetitive_pct = np.random.uniform(0.10, 0.25)
+                    admin_pct = np.random.uniform(0.08, 0.20)
+                
+                collaboration_pct = 1 - (core_pct + repetitive_pct + admin_pct)
+                
+                core_hours = total_hours * core_pct
+                repetitive_hours = total_hours * repetitive_pct
+                admin_hours = total_hours * admin_pct
+                collaboration_hours = total_hours * collaboration_pct
+                
+                # Calculate opportunity cost
+                hourly_rate = annual_salary / 2080  # 2080 = 40hrs/week * 52 weeks
+                low_value_hours = repetitive_hours + admin_hours
+                opportunity_cost = low_value_hours * hourly_rate
+                
+                data_list.append({
+                    'Employee_ID': emp_id,
+                    'Role': role,
+                    'Department': dept,
+                    'Month': month,
+                    'Annual_Salary': annual_salary,
+                    'Monthly_Salary': monthly_salary,
+                    'Hourly_Rate': hourly_rate,
+                    'Total_Hours': total_hours,
+                    'Core_Hours': core_hours,
+                    'Admin_Hours': admin_hours,
+                    'Repetitive_Hours': repetitive_hours,
+                    'Collaboration_Hours': collaboration_hours,
+                    'Low_Value_Hours': low_value_hours,
+                    'Low_Value_Percentage': (low_value_hours / total_hours) * 100,
+                    'Opportunity_Cost_Monthly': opportunity_cost
+                })
+    
+    return pd.DataFrame(data_list)
+
+def warm_up(process_start=None, timings=None):
+    """
+    Imports Plotly and openpyxl, reads the workbook and builds the mock table
+    once per process, printing a startup-time breakdown to the server log.
+    Later calls return the stored results without redoing or re-timing work.
+
+    process_start and timings let serve.py include its own import phases.
+    """
+    global _warm_state
+    with _warm_lock:
+        if _warm_state is not None:
+            return _warm_state
+
+        start = time.perf_counter()
+        timings = dict(timings or {})
+
+        step = time.perf_counter()
+        load_plotly()
+        timings["Plotly import"] = time.perf_counter() - step
+
+        step = time.perf_counter()
+        import openpyxl  # noqa: F401  (read_excel engine)
+        timings["openpyxl import"] = time.perf_counter() - step
+
+        step = time.perf_counter()
+        data, errors = read_workbook()
+        timings["Workbook load"] = time.perf_counter() - step
+
+        step = time.perf_counter()
+        mock = build_mock_role_reality_data()
+        timings["Mock data generation"] = time.perf_counter() - step
+
+        timings["Total"] = time.perf_counter() - (process_start if process_start is not None else start)
+        print("Startup warm-up: " + ", ".join(f"{name} {secs:.2f}s" for name, secs in timings.items()), flush=True)
+
+        _warm_state = {"data": data, "errors": errors, "mock": mock, "timings": timings}
+        return _warm_state
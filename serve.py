@@ -0,0 +1,29 @@
+"""
+Starts the dashboard with Plotly, openpyxl, the workbook and the mock data
+already loaded in the server process, so a new replica can serve its first
+session warm. Use it in place of `streamlit run streamlit_app.py`:
+
+    python serve.py [streamlit run options, e.g. --server.port 8501]
+"""
+import os
+import sys
+import time
+
+PROCESS_START = time.perf_counter()
+
+import kpi_data  # noqa: E402  (pandas, numpy)
+
+DATA_IMPORTS_DONE = time.perf_counter()
+
+from streamlit.web import cli as stcli  # noqa: E402
+
+STREAMLIT_IMPORT_DONE = time.perf_counter()
+
+if __name__ == "__main__":
+    kpi_data.warm_up(PROCESS_START, {
+        "pandas/numpy import": DATA_IMPORTS_DONE - PROCESS_START,
+        "Streamlit import": STREAMLIT_IMPORT_DONE - DATA_IMPORTS_DONE,
+    })
+    app_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "streamlit_app.py")
+    sys.argv = ["streamlit", "run", app_path, *sys.argv[1:]]
+    sys.exit(stcli.main())
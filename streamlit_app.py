@@ -1,8 +1,7 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
+
+import kpi_data
 
 st.set_page_config(page_title="Employee KPI Dashboard", layout="wide", initial_sidebar_state="expanded")
 
@@ -36,114 +35,19 @@ st.markdown("""
 
 @st.cache_data
 def load_data():
-    file_path = "Enhanced_25_Employee_KPI_Dashboard.xlsx"
-    sheets = [
-        "Role_vs_Reality_Analysis",
-        "Hidden_Capacity_Burnout_Risk",
-        "Work_Models_Effectiveness",
-        "Digital_Collaboration_Overload",
-        "Digital_Wellbeing_Index",
-        "Data_Driven_Skill_Gap_Analysis",
-        "High_Value_Work_Ratio",
-        "Future_Skill_Readiness_Index",
-        "Shadow_IT_Risk_Score"
-    ]
-    
-    all_data = {}
-    for sheet in sheets:
-        try:
-            df = pd.read_excel(file_path, sheet_name=sheet)
-            all_data[sheet] = df
-        except Exception as e:
-            st.error(f"Could not load {sheet}: {e}")
-    return all_data
+    """
+    Returns (data, errors) for the KPI sheets. The workbook is read once per
+    process by kpi_data.warm_up(); serve.py does that before the server starts.
+    """
+    state = kpi_data.warm_up()
+    return state["data"], state["errors"]
 
+@st.cache_data
 def create_mock_role_reality_data():
     """
-    Creates realistic mock data for Role vs. Reality Analysis
-    This simulates process mining data showing time allocation
+    Mock Role vs. Reality data, built once per process by kpi_data.warm_up()
     """
-    np.random.seed(42)
-    
-    roles = ['Senior Engineer', 'Sales Manager', 'Data Analyst', 'Product Manager', 
-             'Marketing Lead', 'Finance Analyst', 'Operations Manager', 'HR Business Partner']
-    departments = ['Engineering', 'Sales', 'Analytics', 'Product', 
-                   'Marketing', 'Finance', 'Operations', 'HR']
-    months = pd.date_range('2025-04-01', '2025-09-01', freq='MS')
-    
-    data_list = []
-    
-    for month in months:
-        for i, (role, dept) in enumerate(zip(roles, departments)):
-            # Create 3-5 employees per role
-            for emp_num in range(np.random.randint(3, 6)):
-                emp_id = f"{dept[:3].upper()}{i:02d}{emp_num}"
-                
-                # Salary ranges by role (annual)
-                salary_map = {
-                    'Senior Engineer': np.random.randint(110000, 140000),
-                    'Sales Manager': np.random.randint(90000, 120000),
-                    'Data Analyst': np.random.randint(70000, 90000),
-                    'Product Manager': np.random.randint(100000, 130000),
-                    'Marketing Lead': np.random.randint(80000, 110000),
-                    'Finance Analyst': np.random.randint(65000, 85000),
-                    'Operations Manager': np.random.randint(75000, 95000),
-                    'HR Business Partner': np.random.randint(70000, 90000)
-                }
-                
-                annual_salary = salary_map[role]
-                monthly_salary = annual_salary / 12
-                
-                # Total working hours per month (approx 160 hours)
-                total_hours = 160
-                
-                # Time allocation (varies by role)
-                if role == 'Senior Engineer':
-                    core_pct = np.random.uniform(0.50, 0.70)
-                    repetitive_pct = np.random.uniform(0.15, 0.30)
-                    admin_pct = np.random.uniform(0.05, 0.15)
-                elif role in ['Sales Manager', 'Product Manager']:
-                    core_pct = np.random.uniform(0.40, 0.60)
-                    repetitive_pct = np.random.uniform(0.10, 0.25)
-                    admin_pct = np.random.uniform(0.10, 0.25)
-                else:
-                    core_pct = np.random.uniform(0.45, 0.65)
-                    repetitive_pct = np.random.uniform(0.10, 0.25)
-                    admin_pct = np.random.uniform(0.08, 0.20)
-                
-                collaboration_pct = 1 - (core_pct + repetitive_pct + admin_pct)
-                
-                core_hours = total_hours * core_pct
-                repetitive_hours = total_hours * repetitive_pct
-                admin_hours = total_hours * admin_pct
-                collaboration_hours = total_hours * collaboration_pct
-                
-                # Calculate opportunity cost
-                hourly_rate = annual_salary / 2080  # 2080 = 40hrs/week * 52 weeks
-                low_value_hours = repetitive_hours + admin_hours
-                opportunity_cost = low_value_hours * hourly_rate
-                
-                data_list.append({
-                    'Employee_ID': emp_id,
-                    'Role': role,
-                    'Department': dept,
-                    'Month': month,
-                    'Annual_Salary': annual_salary,
-                    'Monthly_Salary': monthly_salary,
-                    'Hourly_Rate': hourly_rate,
-                    'Total_Hours': total_hours,
-                    'Core_Hours': core_hours,
-                    'Admin_Hours': admin_hours,
-                    'Repetitive_Hours': repetitive_hours,
-                    'Collaboration_Hours': collaboration_hours,
-                    'Low_Value_Hours': low_value_hours,
-                    'Low_Value_Percentage': (low_value_hours / total_hours) * 100,
-                    'Opportunity_Cost_Monthly': opportunity_cost
-                })
-    
-    return pd.DataFrame(data_list)
-
-data = load_data()
+    return kpi_data.warm_up()["mock"]
 
 st.title("Employee KPI Dashboard")
 st.markdown("**Workforce Analytics** | April - September 2025")
@@ -159,6 +63,10 @@ tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
     "💰 Operational Efficiency"  # NEW TAB
 ])
 
+data, load_errors = load_data()
+for error in load_errors:
+    st.error(error)
+
 role_reality = data["Role_vs_Reality_Analysis"]
 high_value = data["High_Value_Work_Ratio"]
 work_models = data["Work_Models_Effectiveness"]
@@ -169,6 +77,9 @@ skill_gap = data["Data_Driven_Skill_Gap_Analysis"]
 skill_ready = data["Future_Skill_Readiness_Index"]
 shadow_it = data["Shadow_IT_Risk_Score"]
 
+# Plotly is only needed from here on; the title and tabs are already on screen
+px, go = kpi_data.load_plotly()
+
 # MONOCHROME COLOR PALETTES
 mono_greys = ['#2c3e50', '#34495e', '#7f8c8d', '#95a5a6', '#bdc3c7', '#ecf0f1']
 mono_blues = ['#0f1f3f', '#1a3a52', '#2d5a6d', '#5a7f94', '#8fa9be', '#c5d9e8']